@@ -11,8 +11,8 @@ sys.path.insert(0, str(src_path))
 # Force monolith mode
 os.environ["DEPLOYMENT_MODE"] = "monolith"
 
-import uvicorn
 from common.config import get_settings
+from common.server import run_server
 
 if __name__ == "__main__":
     settings = get_settings()
@@ -21,17 +21,7 @@ if __name__ == "__main__":
     print(f"⚡ Maximum performance - zero network overhead")
     print(f"🌐 Server: http://{settings.host}:{settings.monolith_port}")
     print(f"📚 Docs: http://{settings.host}:{settings.monolith_port}/docs")
+    print(f"👷 Workers: {settings.workers}")
     print()
 
-    uvicorn.run(
-        "apps.monolith:app",
-        host=settings.host,
-        port=settings.monolith_port,
-        reload=settings.reload,
-        log_level=settings.log_level.lower(),
-        # Configurações para alta concorrência
-        workers=1,                    # Workers (1 para dev, 4+ para prod)
-        backlog=2048,                 # Fila de conexões pendentes
-        limit_concurrency=500,        # Limite de requisições simultâneas
-        timeout_keep_alive=5,         # Keep-alive timeout
-    )
+    run_server("apps.monolith:app", settings.monolith_port)
@@ -11,8 +11,8 @@ sys.path.insert(0, str(src_path))
 # Force microservices mode
 os.environ["DEPLOYMENT_MODE"] = "microservices"
 
-import uvicorn
 from common.config import get_settings
+from common.server import run_server
 
 if __name__ == "__main__":
     settings = get_settings()
@@ -20,16 +20,6 @@ if __name__ == "__main__":
     print(f"🔗 Connects to Vacancy at: {settings.vacancy_url}")
     print(f"🌐 Server: http://{settings.host}:{settings.ticket_port}")
     print(f"📚 Docs: http://{settings.host}:{settings.ticket_port}/docs")
+    print(f"👷 Workers: {settings.workers}")
     print()
-    uvicorn.run(
-        "ticket.main:app",
-        host=settings.host,
-        port=settings.ticket_port,
-        reload=settings.reload,
-        log_level=settings.log_level.lower(),
-        # Configurações para alta concorrência
-        workers=1,                    # Workers (1 para dev, 4+ para prod)
-        backlog=2048,                 # Fila de conexões pendentes
-        limit_concurrency=500,        # Limite de requisições simultâneas
-        timeout_keep_alive=5,         # Keep-alive timeout
-    )
+    run_server("ticket.main:app", settings.ticket_port)
@@ -2,13 +2,17 @@
 Monolithic application - all services in one process.
 Uses LOCAL client (direct function calls, zero network overhead).
 """
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from common.config import get_settings
-from common.logging import setup_logging
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Response
+from common.config import get_settings, DeploymentMode
+from common.logging import setup_logging, start_log_listeners, stop_log_listeners
+from common.http_client import init_http_client, close_http_client
+from common.middleware import DocsGZipMiddleware, add_cors_middleware
+from common.responses import ORJSONResponse
 from vacancy.routes import router as vacancy_router
 from ticket.routes import router as ticket_router
+from ticket.dependencies import get_ticket_service
 
 # Initialize settings and logging
 settings = get_settings()
@@ -17,6 +21,54 @@ logger = setup_logging(
     level=settings.log_level,
     json_logs=settings.json_logs,
 )
+# The mounted routers log through their service loggers
+for service_name in ("vacancy-service", "ticket-service"):
+    setup_logging(service_name, level=settings.log_level, json_logs=settings.json_logs)
+
+# Static bodies, serialized once (probes hit these every few seconds)
+_ROOT_BODY = orjson.dumps({
+    "service": "ticket-system-monolith",
+    "version": "1.0.0",
+    "mode": "monolith",
+    "message": "All services running in single process with direct calls",
+    "performance": "Maximum - zero network overhead between services",
+})
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "mode": "monolith",
+    "services": ["vacancy", "ticket"],
+})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan manager.
+    Handles startup and shutdown events.
+    """
+    # Startup (log writers start here, in the worker process)
+    start_log_listeners()
+    logger.info(
+        "Starting Ticket System Monolith on port %s (initial stock: %s)",
+        settings.monolith_port,
+        settings.initial_stock,
+    )
+    logger.info("Mode: MONOLITH - using direct function calls")
+
+    # Ticket routes use the remote client unless DEPLOYMENT_MODE=monolith
+    if settings.deployment_mode == DeploymentMode.MICROSERVICES:
+        await init_http_client()
+
+    ticket_service = get_ticket_service()
+    ticket_service.start()
+
+    yield
+
+    # Shutdown
+    logger.info("Shutting down Ticket System Monolith")
+    await ticket_service.close()
+    await close_http_client()
+    stop_log_listeners()
 
 
 def create_app() -> FastAPI:
@@ -32,18 +84,15 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # Add middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Configure per environment in production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    add_cors_middleware(app, settings)
 
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Compress docs/OpenAPI only; API responses are too small to benefit
+    app.add_middleware(DocsGZipMiddleware, minimum_size=1000)
 
     # Include both service routers
     app.include_router(vacancy_router, tags=["vacancy"])
@@ -51,34 +100,11 @@ def create_app() -> FastAPI:
 
     @app.get("/")
     async def root():
-        return {
-            "service": "ticket-system-monolith",
-            "version": "1.0.0",
-            "mode": "monolith",
-            "message": "All services running in single process with direct calls",
-            "performance": "Maximum - zero network overhead between services",
-        }
+        return Response(_ROOT_BODY, media_type="application/json")
 
     @app.get("/health")
     async def health():
-        return {
-            "status": "healthy",
-            "mode": "monolith",
-            "services": ["vacancy", "ticket"],
-        }
-
-    @app.on_event("startup")
-    async def startup_event():
-        """Startup event handler."""
-        logger.info(f"Starting Ticket System Monolith on port {settings.monolith_port}")
-        logger.info(f"Initial stock: {settings.initial_stock}")
-        logger.info("Mode: MONOLITH - using direct function calls")
-        logger.info("Performance: Maximum (zero network overhead)")
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        """Shutdown event handler."""
-        logger.info("Shutting down Ticket System Monolith")
+        return Response(_HEALTH_BODY, media_type="application/json")
 
     return app
 
@@ -0,0 +1,107 @@
+"""Request coalescing for reservation hot paths."""
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ReserveBatcher(Generic[T]):
+    """
+    Coalesces concurrent reservations into one downstream call.
+
+    Callers enqueue (qty, future) and await the future. A background task
+    takes the first pending request, waits up to `window` seconds for more
+    to arrive, drains at most `max_items`, executes them in one batch and
+    resolves each future with its own result.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[list[int]], Awaitable[list[T]]],
+        window: float = 0.001,
+        max_items: int = 64,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            execute: Coroutine applying a list of quantities in order and
+                     returning one result per quantity
+            window: Seconds to wait for more requests after the first one
+                    (0 = only batch what is already queued)
+            max_items: Maximum requests per batch
+        """
+        self._execute = execute
+        self._window = window
+        self._max_items = max_items
+        self._queue: asyncio.Queue[tuple[int, asyncio.Future]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background batching task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching task and fail requests in flight or still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(ConnectionError("Reserve batcher stopped"))
+
+        # A queue binds to the loop it first waits on; start fresh so the
+        # batcher can be restarted under a new event loop
+        self._queue = asyncio.Queue()
+
+    async def submit(self, qty: int) -> T:
+        """Queue a reservation and wait for its batch to complete."""
+        if self._task is None:
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((qty, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Batching loop."""
+        batch: list[tuple[int, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                if self._window > 0:
+                    await asyncio.sleep(self._window)
+                while len(batch) < self._max_items and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                # Callers that went away (e.g. client disconnect) are skipped
+                batch = [item for item in batch if not item[1].done()]
+                if not batch:
+                    continue
+
+                try:
+                    results = await self._execute([qty for qty, _ in batch])
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+
+        except BaseException:
+            # Cancelled (stop()) mid-batch: the in-flight batch is no longer
+            # in the queue, so fail its callers here rather than leave them
+            # awaiting forever
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(ConnectionError("Reserve batcher stopped"))
+            raise
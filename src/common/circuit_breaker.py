@@ -0,0 +1,111 @@
+"""Circuit breaker for calls to remote dependencies."""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: calls pass through. After `failure_threshold` consecutive
+    failures the circuit opens and calls fail fast instead of waiting on
+    timeouts. Once `reset_timeout` seconds have passed, one trial call is
+    let through (half-open); its outcome closes or re-opens the circuit.
+
+    An optional background probe refreshes the state proactively, so
+    recovery does not depend on live traffic and readers can use the
+    cached state instead of a network call. Probe failures count toward
+    the same threshold as call failures, and a healthy probe only closes
+    an open circuit once `reset_timeout` has passed.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 5.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._probe_task: Optional[asyncio.Task] = None
+
+    @property
+    def probing(self) -> bool:
+        """Whether the background probe is running."""
+        return self._probe_task is not None
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted now."""
+        if self.state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if now - self.opened_at >= self.reset_timeout:
+            # Let one trial through; others keep failing fast until it reports
+            self.state = HALF_OPEN
+            self.opened_at = now
+            return True
+        return False
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a call."""
+        if success:
+            if self.state != CLOSED:
+                logger.info("Circuit closed")
+            self.state = CLOSED
+            self.failure_count = 0
+            return
+
+        self.failure_count += 1
+        if self.state == HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.trip()
+
+    def trip(self) -> None:
+        """Open the circuit now."""
+        if self.state != OPEN:
+            logger.warning("Circuit opened")
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+
+    def start_probe(self, probe: Callable[[], Awaitable[bool]], interval: float = 5.0) -> None:
+        """Start a background task recording probe() every `interval` seconds."""
+        if self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._run_probe(probe, interval))
+
+    async def stop_probe(self) -> None:
+        """Stop the background probe."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+    async def _run_probe(self, probe: Callable[[], Awaitable[bool]], interval: float) -> None:
+        """Probe loop."""
+        while True:
+            try:
+                healthy = await probe()
+            except Exception:
+                healthy = False
+
+            if not healthy:
+                self.record(False)
+            elif self.state != OPEN or time.monotonic() - self.opened_at >= self.reset_timeout:
+                # A recent trip by live traffic keeps its full open period
+                self.record(True)
+            await asyncio.sleep(interval)
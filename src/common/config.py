@@ -1,7 +1,8 @@
 """Centralized configuration management."""
 from enum import Enum
 from functools import lru_cache
-from pydantic_settings import BaseSettings
+from pydantic import AliasChoices, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class DeploymentMode(str, Enum):
@@ -11,7 +12,14 @@ class DeploymentMode(str, Enum):
 
 
 class Settings(BaseSettings):
-    """Application settings."""
+    """Application settings (loaded once from the environment, read-only)."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+    )
 
     # Deployment configuration
     deployment_mode: DeploymentMode = DeploymentMode.MICROSERVICES
@@ -26,35 +34,86 @@ class Settings(BaseSettings):
     vacancy_port: int = 8001
     monolith_port: int = 8000
     reload: bool = True
+    # Bind to a Unix domain socket instead of host:port (same-host/sidecar)
+    unix_socket: str | None = None
+
+    # Uvicorn tuning. Workers default to 1: each worker process has its own
+    # in-memory fallback stock, so several workers without a shared Redis
+    # (or after a Redis failover) would each sell INITIAL_STOCK
+    uvicorn_workers: int = Field(
+        default=1,
+        validation_alias=AliasChoices("uvicorn_workers", "web_concurrency"),
+    )
+    uvicorn_backlog: int = 2048
+    uvicorn_limit_concurrency: int = 500
+    uvicorn_timeout_keep_alive: int = 5
+
+    # CORS: browser origins allowed to call the API. Empty means CORS is
+    # disabled, except in development where any origin is allowed.
+    cors_origins: list[str] = []
+    cors_allow_credentials: bool = False
 
     # External services
     vacancy_url: str = "http://localhost:8001"
     vacancy_timeout: float = 2.0
+    # Reach the vacancy service over a Unix domain socket; vacancy_url
+    # still provides the Host header and path prefix
+    vacancy_uds: str | None = None
+    # Fail fast after consecutive vacancy errors; probe health in background
+    vacancy_breaker_failures: int = 5
+    vacancy_breaker_reset_seconds: float = 5.0
+    vacancy_health_interval: float = 5.0
+    # Coalesce concurrent purchases into one vacancy reserve call
+    # (window in ms; max size 1 disables batching)
+    purchase_batch_window_ms: float = 0.5
+    purchase_batch_max_size: int = 1000
 
     # Performance
-    http_max_connections: int = 100
-    http_keepalive_connections: int = 20
+    http_max_connections: int = 256
+    http_keepalive_connections: int = 32
+    http_keepalive_expiry: float = 60.0
+    http2_enabled: bool = True
 
     # Stock config
     initial_stock: int = 1000
+    # Max staleness (seconds) of Redis stock reads when client tracking is
+    # off: stale-while-revalidate period
     cache_ttl_seconds: int = 1
 
     # Redis configuration
     redis_url: str = "redis://localhost:6379"
     redis_db: int = 0
-    redis_max_connections: int = 10
+    redis_max_connections: int = 100
     redis_timeout: float = 5.0
     redis_stock_key: str = "ticket_system:stock"
     redis_lock_timeout: float = 10.0
+    redis_batch_window_ms: float = 1.0
+    redis_batch_max_size: int = 64
+    # Startup: per-attempt connect timeout and overall deadline (seconds)
+    # before falling back to in-memory stock
+    redis_connect_timeout: float = 1.5
+    redis_init_deadline: float = 10.0
+    # Serve stock reads from a local copy invalidated by Redis
+    # (CLIENT TRACKING, Redis 6+)
+    redis_client_tracking: bool = True
 
     # Logging
     log_level: str = "INFO"
     json_logs: bool = False
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    @property
+    def workers(self) -> int:
+        """
+        Resolve the number of server worker processes.
+
+        Reload mode is always single-worker (uvicorn cannot reload with
+        multiple workers). Otherwise UVICORN_WORKERS / WEB_CONCURRENCY wins,
+        falling back to a single worker: scaling out is an explicit choice,
+        safe only while stock lives in a shared Redis.
+        """
+        if self.reload:
+            return 1
+        return max(1, self.uvicorn_workers)
 
 
 @lru_cache()
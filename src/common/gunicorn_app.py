@@ -0,0 +1,43 @@
+"""Gunicorn application wrapper for production deployments."""
+from gunicorn.app.base import BaseApplication
+from uvicorn.importer import import_from_string
+from uvicorn.workers import UvicornWorker
+from .server import HTTP, LOOP
+
+
+class UvicornFastWorker(UvicornWorker):
+    """UvicornWorker pinned to uvloop + httptools when installed."""
+
+    CONFIG_KWARGS = {"loop": LOOP, "http": HTTP}
+
+
+class GunicornApplication(BaseApplication):
+    """
+    Embedded Gunicorn application.
+
+    Runs the ASGI app under Gunicorn's pre-fork master with UvicornWorker
+    processes, giving worker supervision (crashed workers are restarted)
+    and graceful reloads on SIGHUP.
+    """
+
+    def __init__(self, app_path: str, options: dict):
+        """
+        Initialize Gunicorn application.
+
+        Args:
+            app_path: Import string of the ASGI app (e.g. "ticket.main:app")
+            options: Gunicorn settings (bind, workers, worker_class, ...)
+        """
+        self.app_path = app_path
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Apply options to Gunicorn's config, ignoring unknown keys."""
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key.lower(), value)
+
+    def load(self):
+        """Import the ASGI application."""
+        return import_from_string(self.app_path)
@@ -3,33 +3,54 @@ import httpx
 from typing import Optional
 from .config import get_settings
 
+# Settings are immutable, resolve once at import time
+settings = get_settings()
 
-# Singleton HTTP client instance
+# Singleton HTTP client instance (created eagerly at application startup)
 _http_client: Optional[httpx.AsyncClient] = None
 
 
-async def get_http_client() -> httpx.AsyncClient:
+async def init_http_client() -> httpx.AsyncClient:
     """
-    Get or create shared HTTP client with connection pooling.
+    Create the shared HTTP client with connection pooling.
 
-    This prevents creating a new client for every request,
-    significantly improving performance.
+    Must be called once from the application lifespan, before any request
+    is served, so that every request shares a single connection pool.
     """
     global _http_client
 
     if _http_client is None:
-        settings = get_settings()
+        # Limits and HTTP/2 go on the transport: httpx ignores client-level
+        # settings when an explicit transport is supplied. HTTP/2 is
+        # negotiated via ALPN, so it only applies to https:// upstreams;
+        # plain http:// keeps using HTTP/1.1 keep-alive connections.
         _http_client = httpx.AsyncClient(
-            timeout=settings.vacancy_timeout,
-            limits=httpx.Limits(
-                max_keepalive_connections=settings.http_keepalive_connections,
-                max_connections=settings.http_max_connections,
+            timeout=httpx.Timeout(settings.vacancy_timeout, connect=1.0),
+            transport=httpx.AsyncHTTPTransport(
+                uds=settings.vacancy_uds,
+                retries=1,
+                http2=settings.http2_enabled,
+                limits=httpx.Limits(
+                    max_keepalive_connections=settings.http_keepalive_connections,
+                    max_connections=settings.http_max_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
             ),
         )
 
     return _http_client
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client.
+
+    The client is created by init_http_client() at startup, so this is a
+    plain lookup with no lazy-initialization race on the request path.
+    """
+    return _http_client
+
+
 async def close_http_client() -> None:
     """Close the HTTP client."""
     global _http_client
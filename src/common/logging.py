@@ -1,12 +1,85 @@
 """Logging configuration."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
+import orjson
+
+# Background listeners per logger name (replaced if setup_logging is re-run)
+# and the names of those currently running
+_listeners: dict[str, logging.handlers.QueueListener] = {}
+_running: set[str] = set()
+
+
+class JsonFormatter(logging.Formatter):
+    """Structured JSON formatter backed by orjson (proper escaping, bytes output)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+class _RawQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records untouched.
+
+    The stock prepare() formats the message (and traceback) on the calling
+    thread and drops exc_info; here all formatting is left to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_log_listeners() -> None:
+    """
+    Start the background log writers.
+
+    Call from the application lifespan, i.e. in each worker process after
+    any fork: a thread started in a preloading Gunicorn master could hold
+    the stdout or queue lock at fork time. Records logged before this are
+    queued and written once the listener starts.
+    """
+    for service_name, listener in _listeners.items():
+        if service_name not in _running:
+            listener.start()
+            _running.add(service_name)
+
+
+def stop_log_listeners() -> None:
+    """Flush queued records and stop the background log writers."""
+    for service_name in list(_running):
+        _listeners[service_name].stop()
+        _running.discard(service_name)
+
+
+def _flush_at_exit() -> None:
+    """Write records still queued at exit, even if no lifespan ran."""
+    start_log_listeners()
+    stop_log_listeners()
+
+
+atexit.register(_flush_at_exit)
+
 
 def setup_logging(service_name: str, level: str = "INFO", json_logs: bool = False) -> logging.Logger:
     """
     Setup standardized logging.
 
+    With json_logs, records are put on an in-memory queue unformatted and
+    a background QueueListener thread does the message/traceback
+    formatting, JSON encoding and stdout write, so the request path only
+    pays for a queue put. The listener is started by start_log_listeners().
+
     Args:
         service_name: Name of the service
         level: Log level (DEBUG, INFO, WARNING, ERROR)
@@ -18,26 +91,33 @@ def setup_logging(service_name: str, level: str = "INFO", json_logs: bool = Fals
     logger = logging.getLogger(service_name)
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers (and stop a previous background listener)
     logger.handlers.clear()
+    previous = _listeners.pop(service_name, None)
+    if previous is not None:
+        # Flush what it queued (briefly starting it if it never ran)
+        if service_name not in _running:
+            previous.start()
+        previous.stop()
+        _running.discard(service_name)
 
     # Console handler
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(getattr(logging, level.upper()))
 
     if json_logs:
-        # In production, you might want to use python-json-logger
-        # For now, use structured format
-        formatter = logging.Formatter(
-            '{"time":"%(asctime)s","name":"%(name)s","level":"%(levelname)s","message":"%(message)s"}'
+        handler.setFormatter(JsonFormatter())
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listeners[service_name] = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
         )
+        logger.addHandler(_RawQueueHandler(log_queue))
     else:
         # Development-friendly format
-        formatter = logging.Formatter(
+        handler.setFormatter(logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+        ))
+        logger.addHandler(handler)
 
     return logger
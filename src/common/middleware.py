@@ -0,0 +1,53 @@
+"""Shared ASGI middleware."""
+from fastapi import FastAPI
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+from .config import Settings
+
+# Documentation routes: the only responses large enough to benefit from gzip
+DOCS_PATHS = frozenset({"/docs", "/redoc", "/openapi.json"})
+
+
+class DocsGZipMiddleware:
+    """
+    GZip compression restricted to documentation routes.
+
+    API responses are tiny JSON payloads (well under 1KB), so running them
+    through GZipMiddleware only adds per-request overhead. This wrapper
+    sends docs paths through gzip and everything else straight to the app.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, compresslevel: int = 6):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in DOCS_PATHS:
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+def add_cors_middleware(app: FastAPI, settings: Settings) -> None:
+    """
+    Install CORS only when browser clients are expected.
+
+    Service-to-service traffic never sends an Origin header, so in
+    production the middleware is skipped unless CORS_ORIGINS is set.
+    Development allows any origin (without credentials, since a wildcard
+    origin cannot be combined with credentials).
+    """
+    origins = settings.cors_origins
+    if not origins and settings.environment == "development":
+        origins = ["*"]
+    if not origins:
+        return
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=settings.cors_allow_credentials and "*" not in origins,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
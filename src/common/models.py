@@ -1,44 +1,62 @@
 """Shared domain models."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class ReserveRequest(BaseModel):
+class SharedModel(BaseModel):
+    """
+    Base for shared API models.
+
+    Instances are immutable value objects: frozen models skip the
+    validate-on-assignment machinery, and from_attributes lets FastAPI
+    build them straight from any object exposing the same attributes.
+    """
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+
+# Request bodies: strict types skip coercion attempts (e.g. "5" -> 5) and
+# unknown keys are ignored rather than checked
+REQUEST_CONFIG = ConfigDict(extra="ignore", strict=True)
+
+
+class ReserveRequest(SharedModel):
     """Request to reserve tickets."""
-    qty: int = Field(..., gt=0, description="Quantity to reserve")
+    model_config = REQUEST_CONFIG
+    qty: int = Field(..., gt=0, strict=True, description="Quantity to reserve")
 
 
-class ReserveResponse(BaseModel):
+class ReserveResponse(SharedModel):
     """Response from reservation attempt."""
     success: bool
     remaining: int = Field(..., ge=0)
     message: str | None = None
 
 
-class PurchaseRequest(BaseModel):
+class PurchaseRequest(SharedModel):
     """Request to purchase tickets."""
-    qty: int = Field(..., gt=0, description="Quantity to purchase")
+    model_config = REQUEST_CONFIG
+    qty: int = Field(..., gt=0, strict=True, description="Quantity to purchase")
 
 
-class PurchaseResponse(BaseModel):
+class PurchaseResponse(SharedModel):
     """Response from purchase attempt."""
     success: bool
     remaining: int = Field(..., ge=0)
     message: str | None = None
 
 
-class AvailableResponse(BaseModel):
+class AvailableResponse(SharedModel):
     """Current availability response."""
     qty: int = Field(..., ge=0, description="Available quantity")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(SharedModel):
     """Standardized error response."""
     error: str
     detail: str | None = None
     code: str
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(SharedModel):
     """Health check response."""
     status: str
     service: str
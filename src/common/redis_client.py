@@ -1,12 +1,14 @@
 """Redis-based distributed stock management with atomic operations."""
 import asyncio
 import logging
-import random
 from typing import Optional
-from datetime import datetime
+
+from .batching import ReserveBatcher
 
 try:
     import redis.asyncio as aioredis
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from redis.exceptions import TimeoutError as RedisTimeoutError
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
@@ -14,66 +16,295 @@ except ImportError:
     class aioredis:
         class Redis:
             pass
-        class WatchError(Exception):
-            pass
+
+    RedisConnectionError = ConnectionError
+    RedisTimeoutError = TimeoutError
+
+# Errors meaning Redis is unreachable (as opposed to a bug or a bad reply):
+# only these justify failing over to the in-memory backend
+REDIS_UNAVAILABLE_ERRORS = (ConnectionError, TimeoutError, RedisConnectionError, RedisTimeoutError)
 
 logger = logging.getLogger(__name__)
 
+# Atomic check-and-decrement: returns {1, remaining} on success,
+# {0, current} when stock is insufficient
+RESERVE_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1])) or 0
+local qty = tonumber(ARGV[1])
+if current >= qty then
+    return {1, redis.call('DECRBY', KEYS[1], qty)}
+end
+return {0, current}
+"""
+
+# Batched variant: ARGV holds one quantity per request, applied in
+# submission order exactly as sequential reserves would be. Returns a flat
+# {ok1, remaining1, ok2, remaining2, ...} list with a single DECRBY.
+BATCH_RESERVE_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1])) or 0
+local start = current
+local result = {}
+for i = 1, #ARGV do
+    local qty = tonumber(ARGV[i])
+    if current >= qty then
+        current = current - qty
+        result[#result + 1] = 1
+    else
+        result[#result + 1] = 0
+    end
+    result[#result + 1] = current
+end
+if current ~= start then
+    redis.call('DECRBY', KEYS[1], start - current)
+end
+return result
+"""
+
+# Server-assisted client-side caching: Redis publishes the names of
+# changed tracked keys here (RESP2 redirect mode)
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# Seconds of listener idleness after which both tracking connections are
+# PINGed: a dropped tracking connection stops invalidations silently, so
+# caching is switched off on any error or missing PONG
+TRACKING_HEALTH_INTERVAL = 5.0
+
+
+def create_connection_pool(redis_url: str, max_connections: int = 100) -> "aioredis.ConnectionPool":
+    """
+    Create a Redis connection pool with Kubernetes-optimized settings.
+
+    Args:
+        redis_url: Redis connection URL
+        max_connections: Pool size (sized for the server concurrency limit)
+
+    Returns:
+        Connection pool; replies are parsed by hiredis (C parser)
+        automatically when it is installed
+    """
+    return aioredis.ConnectionPool.from_url(
+        redis_url,
+        encoding="utf-8",
+        decode_responses=True,
+        socket_connect_timeout=10,  # Increased for K8s
+        socket_timeout=10,          # Increased for K8s
+        retry_on_timeout=True,
+        retry_on_error=[ConnectionError, TimeoutError],
+        health_check_interval=30,
+        max_connections=max_connections,
+        # Kubernetes-specific optimizations
+        socket_keepalive=True,
+        socket_keepalive_options={},
+    )
+
 
 class RedisStockManager:
     """
     Redis-based distributed stock manager with atomic operations.
-    Uses Redis transactions and locks to ensure data consistency across multiple instances.
+    Uses a server-side Lua script to ensure data consistency across multiple instances.
+
+    Stock reads are served from a local copy while Redis (6+) reports,
+    via CLIENT TRACKING, that the key has not changed since it was read.
     """
 
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        batch_window: float = 0.001,
+        batch_max_items: int = 64,
+        max_connections: int = 100,
+        connection_pool: Optional["aioredis.ConnectionPool"] = None,
+        client_tracking: bool = True,
+    ):
         """
         Initialize Redis stock manager.
 
         Args:
             redis_url: Redis connection URL
+            batch_window: Seconds to coalesce concurrent reserves into one call
+            batch_max_items: Max reserves per batch (1 disables batching)
+            max_connections: Connection pool size
+            connection_pool: Shared pool to use instead of creating one; it is
+                             owned (and closed) by the caller
+            client_tracking: Cache the stock value locally, invalidated by
+                             the server (falls back to plain GETs when the
+                             server does not support CLIENT TRACKING)
         """
         self.redis_url = redis_url
+        self.max_connections = max_connections
+        self.connection_pool = connection_pool
         self.redis: Optional[aioredis.Redis] = None
         self.stock_key = "ticket_stock"
-        self.lock_key = "ticket_stock_lock"
-        self.lock_timeout = 5  # seconds - Reduced for faster lock turnover
+        self.batch_window = batch_window
+        self.batch_max_items = batch_max_items
+        self._reserve_script = None
+        self._batch_reserve_script = None
+        self._batcher: Optional[ReserveBatcher] = None
         self._connected = False
 
+        # Client-side cache: valid only while _tracking is on; every
+        # invalidation bumps _invalidations so in-flight reads can tell
+        # whether the key changed under them
+        self.client_tracking = client_tracking
+        self._tracking = False
+        self._local_value: Optional[int] = None
+        self._invalidations = 0
+        self._invalidation_conn = None
+        self._tracking_conn = None
+        self._invalidation_task: Optional[asyncio.Task] = None
+
     async def connect(self) -> None:
         """Establish Redis connection with Kubernetes-optimized settings."""
         try:
             logger.info(f"🔗 Connecting to Redis at: {self.redis_url}")
             
-            self.redis = aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                socket_connect_timeout=10,  # Increased for K8s
-                socket_timeout=10,          # Increased for K8s
-                retry_on_timeout=True,
-                retry_on_error=[ConnectionError, TimeoutError],
-                health_check_interval=30,
-                max_connections=20,
-                # Kubernetes-specific optimizations
-                socket_keepalive=True,
-                socket_keepalive_options={},
+            pool = self.connection_pool or create_connection_pool(
+                self.redis_url, self.max_connections
             )
-            
-            # Test connection with retry
+            # Explicitly pooled: each command checks out its own connection,
+            # so concurrent reserves never serialize on one socket
+            self.redis = aioredis.Redis(connection_pool=pool, single_connection_client=False)
+            if self.connection_pool is None:
+                # Private pool, closed together with the client
+                self.redis.auto_close_connection_pool = True
+
+            # Test the connection and preload the reserve scripts (so the
+            # first reservation is already a plain EVALSHA) in one round-trip
             logger.info("🔍 Testing Redis connection...")
-            await self.redis.ping()
+            self._reserve_script = self.redis.register_script(RESERVE_SCRIPT)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                pipe.script_load(RESERVE_SCRIPT)
+                if self.batch_max_items > 1:
+                    pipe.script_load(BATCH_RESERVE_SCRIPT)
+                await pipe.execute()
+
+            if self.batch_max_items > 1:
+                self._batch_reserve_script = self.redis.register_script(BATCH_RESERVE_SCRIPT)
+                self._batcher = ReserveBatcher(
+                    self._reserve_batch,
+                    window=self.batch_window,
+                    max_items=self.batch_max_items,
+                )
+                self._batcher.start()
+
+            if self.client_tracking:
+                await self._enable_tracking()
+
             self._connected = True
             logger.info(f"✅ Successfully connected to Redis: {self.redis_url}")
             
         except Exception as e:
             self._connected = False
+            if self._batcher:
+                await self._batcher.stop()
+                self._batcher = None
+            await self._disable_tracking()
             logger.error(f"❌ Failed to connect to Redis: {e}")
             logger.error(f"❌ Redis URL: {self.redis_url}")
             raise
 
+    @property
+    def tracking(self) -> bool:
+        """Whether reads are served from the server-invalidated local cache."""
+        return self._tracking
+
+    async def _enable_tracking(self) -> None:
+        """
+        Turn on server-assisted client-side caching for the stock key.
+
+        One dedicated connection subscribes to the invalidation channel; a
+        second enables CLIENT TRACKING in broadcast mode for the stock key,
+        redirecting invalidations to the first. Neither goes back to the
+        pool; the listener keeps both alive with PINGs. Servers without
+        tracking just leave the cache off.
+        """
+        pool = self.redis.connection_pool
+        try:
+            self._invalidation_conn = pool.make_connection()
+            await self._invalidation_conn.connect()
+            await self._invalidation_conn.send_command("CLIENT", "ID")
+            client_id = await self._invalidation_conn.read_response()
+            await self._invalidation_conn.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+            await self._invalidation_conn.read_response()
+
+            # Tracking state belongs to this connection: it stays open, idle
+            self._tracking_conn = pool.make_connection()
+            await self._tracking_conn.connect()
+            await self._tracking_conn.send_command(
+                "CLIENT", "TRACKING", "ON", "REDIRECT", client_id,
+                "BCAST", "PREFIX", self.stock_key, "NOLOOP",
+            )
+            await self._tracking_conn.read_response()
+        except Exception as e:
+            logger.warning(f"Client-side caching disabled (CLIENT TRACKING unavailable): {e}")
+            await self._disable_tracking()
+            return
+
+        self._local_value = None
+        self._tracking = True
+        self._invalidation_task = asyncio.create_task(self._listen_invalidations())
+        logger.info(f"Client-side caching enabled for {self.stock_key}")
+
+    async def _listen_invalidations(self) -> None:
+        """
+        Drop the cached stock value whenever Redis reports the key changed.
+
+        When idle, PINGs the tracking connection (reply read directly) and
+        the subscriber (PONG arrives through this loop); an error or a PONG
+        not back within one interval disables caching.
+        """
+        awaiting_pong = False
+        try:
+            while True:
+                message = await self._invalidation_conn.read_response(
+                    timeout=TRACKING_HEALTH_INTERVAL
+                )
+                if message is None:
+                    if awaiting_pong:
+                        raise ConnectionError("No PONG on the invalidation connection")
+                    await self._tracking_conn.send_command("PING")
+                    await self._tracking_conn.read_response()
+                    await self._invalidation_conn.send_command("PING")
+                    awaiting_pong = True
+                elif message[0] == "pong":
+                    awaiting_pong = False
+                else:
+                    self._invalidations += 1
+                    self._local_value = None
+        except Exception as e:
+            # Without the listener cached values could go stale: stop caching
+            logger.warning(f"Invalidation listener failed, client-side caching disabled: {e}")
+            self._tracking = False
+            self._local_value = None
+
+    async def _disable_tracking(self) -> None:
+        """Stop the invalidation listener and close the tracking connections."""
+        self._tracking = False
+        self._local_value = None
+
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+
+        for conn in (self._invalidation_conn, self._tracking_conn):
+            if conn is not None:
+                await conn.disconnect()
+        self._invalidation_conn = None
+        self._tracking_conn = None
+
     async def disconnect(self) -> None:
         """Close Redis connection."""
+        if self._batcher:
+            await self._batcher.stop()
+            self._batcher = None
+
+        await self._disable_tracking()
+
         if self.redis:
             try:
                 await self.redis.close()
@@ -87,27 +318,38 @@ class RedisStockManager:
         """Alias for disconnect for consistency."""
         await self.disconnect()
 
-    async def initialize_stock(self, initial_value: int) -> None:
+    async def initialize_stock(self, initial_value: int) -> int:
         """
         Initialize stock value if not exists.
 
         Args:
             initial_value: Initial stock quantity
+
+        Returns:
+            Current stock quantity after initialization
         """
         if not self._connected or not self.redis:
             raise ConnectionError("Redis not connected")
 
-        # Use SET NX to only set if key doesn't exist
-        was_set = await self.redis.set(self.stock_key, initial_value, nx=True)
+        # SET NX (only if the key doesn't exist) and read back in one round-trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self.stock_key, initial_value, nx=True)
+            pipe.get(self.stock_key)
+            was_set, current = await pipe.execute()
+
         if was_set:
             logger.info(f"Initialized Redis stock to {initial_value}")
         else:
-            current = await self.redis.get(self.stock_key)
             logger.info(f"Redis stock already exists: {current}")
+        return int(current)
 
     async def reserve(self, qty: int) -> tuple[bool, int]:
         """
-        Atomically reserve quantity using Redis transactions.
+        Atomically reserve quantity with a server-side Lua script.
+
+        The check-and-decrement runs inside Redis in a single round-trip,
+        so no distributed lock or WATCH/MULTI retry loop is needed.
+        Concurrent reserves are coalesced by the batcher when enabled.
 
         Args:
             qty: Quantity to reserve
@@ -125,82 +367,40 @@ class RedisStockManager:
         if not self._connected or not self.redis:
             raise ConnectionError("Redis not connected")
 
-        # Use distributed lock to ensure atomicity across multiple instances
-        lock_acquired = False
-        max_retries = 5  # Increased retries for high-concurrency scenarios
-        try:
-            # Try to acquire distributed lock with exponential backoff
-            for attempt in range(max_retries):
-                lock_acquired = await self.redis.set(
-                    self.lock_key, 
-                    f"locked_by_{id(self)}_{datetime.now().isoformat()}", 
-                    nx=True, 
-                    ex=self.lock_timeout
-                )
-                
-                if lock_acquired:
-                    break
-                    
-                # Shorter exponential backoff for faster lock turnover
-                if attempt < max_retries - 1:
-                    wait_time = (0.01 * (2 ** attempt)) + (random.random() * 0.01)
-                    await asyncio.sleep(wait_time)
-
-            if not lock_acquired:
-                raise RuntimeError("Could not acquire distributed lock for stock reservation")
-
-            # Perform atomic transaction
-            async with self.redis.pipeline(transaction=True) as pipe:
-                while True:
-                    try:
-                        # Watch the stock key for changes
-                        await pipe.watch(self.stock_key)
-                        
-                        # Get current stock OUTSIDE pipeline (before multi())
-                        current_stock = await self.redis.get(self.stock_key)
-                        if current_stock is None:
-                            current_stock = 0
-                        else:
-                            current_stock = int(current_stock)
-
-                        # Check if reservation is possible
-                        if current_stock >= qty:
-                            # Start transaction
-                            pipe.multi()
-                            new_stock = current_stock - qty
-                            pipe.set(self.stock_key, new_stock)
-                            
-                            # Execute transaction
-                            result = await pipe.execute()
-                            logger.info(f"Redis reserve successful: {current_stock} -> {new_stock} (qty={qty})")
-                            return True, new_stock
-                        else:
-                            # Insufficient stock
-                            logger.warning(f"Insufficient stock for reservation: {current_stock} < {qty}")
-                            return False, current_stock
-
-                    except aioredis.WatchError:
-                        # Key was modified during transaction, retry
-                        logger.debug("Redis transaction conflict, retrying...")
-                        continue
-                    except Exception as e:
-                        logger.error(f"Redis reserve transaction error: {e}")
-                        raise
-
-        finally:
-            if lock_acquired and self.redis:
-                # Release distributed lock
-                try:
-                    await self.redis.delete(self.lock_key)
-                except Exception as e:
-                    logger.warning(f"Failed to release distributed lock: {e}")
+        seen = self._invalidations
+        if self._batcher:
+            ok, remaining = await self._batcher.submit(qty)
+        else:
+            # EVALSHA, transparently reloading the script on NOSCRIPT
+            ok, remaining = await self._reserve_script(keys=[self.stock_key], args=[qty])
+            ok, remaining = bool(ok), int(remaining)
+
+        if self._tracking and self._invalidations == seen:
+            self._local_value = remaining
+
+        if not ok:
+            logger.warning(f"Insufficient stock for reservation: {remaining} < {qty}")
+        return ok, remaining
+
+    async def _reserve_batch(self, quantities: list[int]) -> list[tuple[bool, int]]:
+        """
+        Apply a batch of reservations in one round-trip.
+
+        Args:
+            quantities: Quantities in submission order
+
+        Returns:
+            (success, remaining) per quantity, same order
+        """
+        flat = await self._batch_reserve_script(keys=[self.stock_key], args=quantities)
+        return [(bool(flat[i]), int(flat[i + 1])) for i in range(0, len(flat), 2)]
 
     async def get_current(self, use_cache: bool = True) -> int:
         """
         Get current stock value.
 
         Args:
-            use_cache: Unused for Redis (always fetches latest)
+            use_cache: Serve the client-side cached value when tracking is on
 
         Returns:
             Current stock quantity
@@ -211,13 +411,22 @@ class RedisStockManager:
         if not self._connected or not self.redis:
             raise ConnectionError("Redis not connected")
 
+        if use_cache and self._tracking and self._local_value is not None:
+            return self._local_value
+
+        seen = self._invalidations
         try:
             stock = await self.redis.get(self.stock_key)
-            return int(stock) if stock is not None else 0
         except Exception as e:
             logger.error(f"Failed to get stock from Redis: {e}")
             raise
 
+        current = int(stock) if stock is not None else 0
+        # Cache only if no invalidation arrived while the GET was in flight
+        if self._tracking and self._invalidations == seen:
+            self._local_value = current
+        return current
+
     async def health_check(self) -> dict:
         """
         Perform health check on Redis connection.
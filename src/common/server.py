@@ -0,0 +1,68 @@
+"""Server runner shared by the scripts/run_*.py entry points."""
+import importlib.util
+import uvicorn
+from uvicorn.importer import import_from_string
+from .config import get_settings
+
+# C-based event loop and HTTP parser, with pure-Python fallback where
+# unavailable (e.g. uvloop on Windows)
+LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+HTTP = "httptools" if importlib.util.find_spec("httptools") else "auto"
+
+
+def run_server(app_path: str, port: int) -> None:
+    """
+    Run an ASGI application.
+
+    Production (ENVIRONMENT=production, RELOAD=false) runs under Gunicorn
+    with uvicorn workers for worker supervision and graceful restarts.
+    Everything else uses plain uvicorn (required for auto-reload).
+
+    Args:
+        app_path: Import string of the ASGI app (e.g. "ticket.main:app")
+        port: Port to bind
+    """
+    settings = get_settings()
+    bind = f"unix:{settings.unix_socket}" if settings.unix_socket else f"{settings.host}:{port}"
+
+    if settings.environment == "production" and not settings.reload:
+        from .gunicorn_app import GunicornApplication
+
+        GunicornApplication(
+            app_path,
+            {
+                "bind": bind,
+                "workers": settings.workers,
+                "worker_class": "common.gunicorn_app.UvicornFastWorker",
+                "loglevel": settings.log_level.lower(),
+                # Configurações para alta concorrência
+                "keepalive": settings.uvicorn_timeout_keep_alive,
+                "backlog": settings.uvicorn_backlog,
+                "worker_connections": settings.uvicorn_limit_concurrency,
+                "graceful_timeout": 30,
+                # Import the app once in the master; forked workers share
+                # the loaded modules copy-on-write
+                "preload_app": True,
+            },
+        ).run()
+        return
+
+    # Reload and multi-worker modes need the import string; a single
+    # worker gets the already-imported application object
+    app = app_path if settings.workers > 1 or settings.reload else import_from_string(app_path)
+
+    uvicorn.run(
+        app,
+        host=settings.host,
+        port=port,
+        uds=settings.unix_socket,
+        reload=settings.reload,
+        log_level=settings.log_level.lower(),
+        loop=LOOP,
+        http=HTTP,
+        # Configurações para alta concorrência
+        workers=settings.workers,                                # Workers (1 por padrão; mais só com Redis compartilhado)
+        backlog=settings.uvicorn_backlog,                        # Fila de conexões pendentes
+        limit_concurrency=settings.uvicorn_limit_concurrency,    # Limite de requisições simultâneas
+        timeout_keep_alive=settings.uvicorn_timeout_keep_alive,  # Keep-alive timeout
+    )
@@ -2,8 +2,21 @@
 Domain interfaces using Python's Protocol (structural typing).
 Both local and remote implementations must satisfy these contracts.
 """
-from typing import Protocol, runtime_checkable
-from common.models import ReserveRequest, ReserveResponse, AvailableResponse
+from typing import NamedTuple, Protocol, runtime_checkable
+from common.models import ReserveResponse, AvailableResponse
+
+
+class ReserveResult(NamedTuple):
+    """
+    Lightweight reservation result for in-process calls.
+
+    Exposes the same attributes as ReserveResponse without Pydantic
+    construction and validation.
+    """
+
+    success: bool
+    remaining: int
+    message: str | None = None
 
 
 @runtime_checkable
@@ -16,15 +29,19 @@ class VacancyClient(Protocol):
     monolithic and microservices deployment modes.
     """
 
-    async def reserve(self, request: ReserveRequest) -> ReserveResponse:
+    async def reserve(self, qty: int) -> ReserveResponse | ReserveResult:
         """
         Reserve tickets.
 
+        Callers validate qty; remote clients wrap it in a ReserveRequest
+        only at the HTTP boundary.
+
         Args:
-            request: Reservation request with quantity
+            qty: Quantity to reserve (> 0)
 
         Returns:
             Reservation response with success status and remaining inventory
+            (a ReserveResponse, or a ReserveResult for in-process clients)
         """
         ...
 
@@ -3,8 +3,8 @@ Local implementation of VacancyClient.
 Makes direct function calls - NO HTTP overhead.
 Used in monolithic mode.
 """
-from common.models import ReserveRequest, ReserveResponse, AvailableResponse
-from domain.interfaces import VacancyClient
+from common.models import AvailableResponse
+from domain.interfaces import VacancyClient, ReserveResult
 from domain.exceptions import InvalidQuantityError
 from vacancy.services import VacancyService
 from vacancy.dependencies import get_vacancy_service
@@ -29,32 +29,27 @@ class LocalVacancyClient:
         """
         self._service = vacancy_service or get_vacancy_service()
 
-    async def reserve(self, request: ReserveRequest) -> ReserveResponse:
+    async def reserve(self, qty: int) -> ReserveResult:
         """
         Reserve tickets via direct call.
 
         This bypasses all HTTP overhead and calls the service directly.
 
         Args:
-            request: Reservation request
+            qty: Quantity to reserve
 
         Returns:
-            Reservation response
+            Reservation result (plain NamedTuple, no Pydantic validation)
 
         Raises:
             InvalidQuantityError: If quantity is invalid
         """
         try:
-            success, remaining, message = await self._service.reserve(request.qty)
-
-            return ReserveResponse(
-                success=success,
-                remaining=remaining,
-                message=message,
-            )
+            success, remaining, message = await self._service.reserve(qty)
+            return ReserveResult(success, remaining, message)
 
         except ValueError as e:
-            raise InvalidQuantityError(request.qty) from e
+            raise InvalidQuantityError(qty) from e
 
     async def get_available(self) -> AvailableResponse:
         """
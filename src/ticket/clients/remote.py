@@ -3,12 +3,14 @@ Remote implementation of VacancyClient.
 Makes HTTP calls to external vacancy service.
 Used in microservices mode.
 """
+import asyncio
 import httpx
 from common.models import ReserveRequest, ReserveResponse, AvailableResponse
 from domain.interfaces import VacancyClient
 from domain.exceptions import VacancyServiceError
 from common.config import get_settings
 from common.http_client import get_http_client
+from common.circuit_breaker import CircuitBreaker, OPEN
 
 
 class RemoteVacancyClient:
@@ -17,7 +19,8 @@ class RemoteVacancyClient:
     Used when vacancy service is deployed separately.
 
     This implementation uses HTTP with connection pooling for
-    communication with the remote vacancy service.
+    communication with the remote vacancy service. A circuit breaker
+    fails calls fast while the vacancy service is down.
     """
 
     def __init__(self, http_client: httpx.AsyncClient | None = None):
@@ -31,40 +34,76 @@ class RemoteVacancyClient:
         self.base_url = self.settings.vacancy_url
         self._client = http_client
 
+        # Settings are immutable: build URLs and timeouts once, not per request
+        self._reserve_url = f"{self.base_url}/api/v1/reserve"
+        self._available_url = f"{self.base_url}/api/v1/available"
+        self._health_url = f"{self.base_url}/api/v1/health"
+        self._timeout = httpx.Timeout(self.settings.vacancy_timeout, connect=1.0)
+        self._health_timeout = httpx.Timeout(1.0)
+        self._json_headers = {"content-type": "application/json"}
+
+        self.breaker = CircuitBreaker(
+            failure_threshold=self.settings.vacancy_breaker_failures,
+            reset_timeout=self.settings.vacancy_breaker_reset_seconds,
+        )
+
+    def start_health_probe(self) -> None:
+        """Start refreshing the circuit state in the background (call from lifespan)."""
+        self.breaker.start_probe(self._ping, self.settings.vacancy_health_interval)
+
+    async def stop_health_probe(self) -> None:
+        """Stop the background health probe."""
+        await self.breaker.stop_probe()
+
+    def _record_failure(self, error: httpx.HTTPError) -> None:
+        """Record a failed call; 4xx replies mean the service itself is up."""
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code < 500:
+            self.breaker.record(True)
+        else:
+            self.breaker.record(False)
+
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client (lazy initialization)."""
+        """Get HTTP client (shared client is created at application startup)."""
         if self._client is None:
-            self._client = await get_http_client()
+            self._client = get_http_client()
         return self._client
 
-    async def reserve(self, request: ReserveRequest) -> ReserveResponse:
+    async def reserve(self, qty: int) -> ReserveResponse:
         """
         Reserve tickets via HTTP.
 
         Args:
-            request: Reservation request
+            qty: Quantity to reserve (already validated by the caller)
 
         Returns:
             Reservation response
 
         Raises:
-            VacancyServiceError: If HTTP request fails
+            VacancyServiceError: If HTTP request fails or the circuit is open
         """
+        if not self.breaker.allow_request():
+            raise VacancyServiceError("Failed to reserve tickets: circuit open")
+
         try:
             client = await self._get_client()
             response = await client.post(
-                f"{self.base_url}/api/v1/reserve",
-                json=request.model_dump(),
-                timeout=self.settings.vacancy_timeout,
+                self._reserve_url,
+                # Pydantic serializes straight to JSON bytes (no dict + stdlib json)
+                content=ReserveRequest.model_construct(qty=qty).model_dump_json().encode(),
+                headers=self._json_headers,
+                timeout=self._timeout,
             )
             response.raise_for_status()
-            return ReserveResponse(**response.json())
 
         except httpx.HTTPError as e:
+            self._record_failure(e)
             raise VacancyServiceError(
                 f"Failed to reserve tickets: {str(e)}"
             ) from e
 
+        self.breaker.record(True)
+        return ReserveResponse.model_validate_json(response.content)
+
     async def get_available(self) -> AvailableResponse:
         """
         Get available inventory via HTTP.
@@ -73,35 +112,50 @@ class RemoteVacancyClient:
             Available response
 
         Raises:
-            VacancyServiceError: If HTTP request fails
+            VacancyServiceError: If HTTP request fails or the circuit is open
         """
+        if not self.breaker.allow_request():
+            raise VacancyServiceError("Failed to get availability: circuit open")
+
         try:
             client = await self._get_client()
             response = await client.get(
-                f"{self.base_url}/api/v1/available",
-                timeout=self.settings.vacancy_timeout,
+                self._available_url,
+                timeout=self._timeout,
             )
             response.raise_for_status()
-            return AvailableResponse(**response.json())
 
         except httpx.HTTPError as e:
+            self._record_failure(e)
             raise VacancyServiceError(
                 f"Failed to get availability: {str(e)}"
             ) from e
 
+        self.breaker.record(True)
+        return AvailableResponse.model_validate_json(response.content)
+
     async def health_check(self) -> bool:
         """
-        Health check via HTTP.
+        Health check.
+
+        While the background probe runs this returns the cached circuit
+        state (no network call); otherwise it checks over HTTP.
 
         Returns:
             True if service is reachable and healthy, False otherwise
         """
+        if self.breaker.probing:
+            return self.breaker.state != OPEN
+        return await self._ping()
+
+    async def _ping(self) -> bool:
+        """Health check via HTTP HEAD (status only, no body)."""
         try:
             client = await self._get_client()
-            response = await client.get(
-                f"{self.base_url}/api/v1/health",
-                timeout=2.0,
+            response = await client.head(
+                self._health_url,
+                timeout=self._health_timeout,
             )
-            return response.status_code == 200
-        except:
+            return response.status_code < 400
+        except (httpx.HTTPError, asyncio.TimeoutError):
             return False
@@ -1,37 +1,38 @@
 """Dependency injection for ticket service."""
+from functools import lru_cache
+
+from common.config import get_settings
 from domain.interfaces import VacancyClient
 from .services import TicketService
 from .clients import create_vacancy_client
 
 
-# Singleton instances
-_vacancy_client: VacancyClient | None = None
-_ticket_service: TicketService | None = None
+# Singletons are cached by lru_cache: FastAPI resolves these on every
+# request, and a cache hit is a single C-level lookup
 
 
+@lru_cache(maxsize=1)
 def get_vacancy_client() -> VacancyClient:
     """
     Get or create vacancy client.
 
     Automatically selects Local or Remote based on deployment mode.
     """
-    global _vacancy_client
-    if _vacancy_client is None:
-        _vacancy_client = create_vacancy_client()
-    return _vacancy_client
+    return create_vacancy_client()
 
 
+@lru_cache(maxsize=1)
 def get_ticket_service() -> TicketService:
     """Get or create ticket service singleton."""
-    global _ticket_service
-    if _ticket_service is None:
-        vacancy_client = get_vacancy_client()
-        _ticket_service = TicketService(vacancy_client)
-    return _ticket_service
+    settings = get_settings()
+    return TicketService(
+        get_vacancy_client(),
+        batch_window=settings.purchase_batch_window_ms / 1000,
+        batch_max_items=settings.purchase_batch_max_size,
+    )
 
 
 def reset_dependencies():
     """Reset singletons (useful for testing)."""
-    global _vacancy_client, _ticket_service
-    _vacancy_client = None
-    _ticket_service = None
+    get_vacancy_client.cache_clear()
+    get_ticket_service.cache_clear()
@@ -1,11 +1,12 @@
 """Ticket service FastAPI application."""
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from common.config import get_settings, DeploymentMode
-from common.logging import setup_logging
-from common.http_client import get_http_client, close_http_client
+from common.logging import setup_logging, start_log_listeners, stop_log_listeners
+from common.middleware import DocsGZipMiddleware, add_cors_middleware
+from common.responses import ORJSONResponse
+from common.http_client import init_http_client, close_http_client
+from .dependencies import get_ticket_service, get_vacancy_client
 from .routes import router
 
 # Initialize settings and logging
@@ -23,28 +24,44 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
     Handles startup and shutdown events.
     """
-    # Startup
+    # Startup (log writers start here, in the worker process)
+    start_log_listeners()
     logger.info(f"Starting Ticket Service on port {settings.ticket_port}")
     logger.info(f"Deployment mode: {settings.deployment_mode.value}")
 
     # Initialize HTTP client only in microservices mode
     if settings.deployment_mode == DeploymentMode.MICROSERVICES:
         logger.info(f"Vacancy service URL: {settings.vacancy_url}")
-        await get_http_client()
+        await init_http_client()
         logger.info("HTTP client initialized with connection pooling")
     else:
         logger.info("Running in monolith mode - using direct local calls")
 
+    # Build the dependency chain now so the first request doesn't pay for it
+    ticket_service = get_ticket_service()
+    ticket_service.start()
+
+    if settings.deployment_mode == DeploymentMode.MICROSERVICES:
+        vacancy_client = get_vacancy_client()
+        # Warm-up call: opens the first pooled connection before traffic arrives
+        if not await vacancy_client.health_check():
+            logger.warning("Vacancy service not reachable at startup")
+        vacancy_client.start_health_probe()
+
     yield
 
     # Shutdown
     logger.info("Shutting down Ticket Service")
+    await ticket_service.close()
 
     # Close HTTP client only if it was initialized
     if settings.deployment_mode == DeploymentMode.MICROSERVICES:
+        await get_vacancy_client().stop_health_probe()
         await close_http_client()
         logger.info("HTTP client closed")
 
+    stop_log_listeners()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -53,19 +70,15 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# Add middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure per environment in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add middleware (CORS only if browser origins are configured)
+add_cors_middleware(app, settings)
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Compress docs/OpenAPI only; API responses are too small to benefit
+app.add_middleware(DocsGZipMiddleware, minimum_size=1000)
 
 # Include routers
 app.include_router(router)
@@ -1,7 +1,10 @@
 """Ticket service business logic."""
 from domain.interfaces import VacancyClient
 from domain.exceptions import InvalidQuantityError, VacancyServiceError
-from common.models import ReserveRequest
+from common.batching import ReserveBatcher
+
+# (success, remaining, message) for one purchase
+PurchaseResult = tuple[bool, int, str | None]
 
 
 class TicketService:
@@ -16,15 +19,41 @@ class TicketService:
     code to work in both monolithic and microservices modes.
     """
 
-    def __init__(self, vacancy_client: VacancyClient):
+    def __init__(
+        self,
+        vacancy_client: VacancyClient,
+        batch_window: float = 0.0005,
+        batch_max_items: int = 1000,
+    ):
         """
         Initialize ticket service.
 
         Args:
             vacancy_client: Client for communicating with vacancy service.
                           Can be LocalVacancyClient or RemoteVacancyClient.
+            batch_window: Seconds to collect concurrent purchases into one
+                          vacancy reserve call
+            batch_max_items: Maximum purchases per reserve call (1 disables
+                             batching)
         """
         self.vacancy_client = vacancy_client
+        self._batcher: ReserveBatcher[PurchaseResult] | None = None
+        if batch_max_items > 1:
+            self._batcher = ReserveBatcher(
+                self._reserve_batch,
+                window=batch_window,
+                max_items=batch_max_items,
+            )
+
+    def start(self) -> None:
+        """Start the purchase batcher (call from the application lifespan)."""
+        if self._batcher is not None:
+            self._batcher.start()
+
+    async def close(self) -> None:
+        """Stop the purchase batcher."""
+        if self._batcher is not None:
+            await self._batcher.stop()
 
     async def purchase(self, qty: int) -> tuple[bool, int, str]:
         """
@@ -47,15 +76,57 @@ class TicketService:
             raise InvalidQuantityError(qty)
 
         # Reserve from vacancy service (local or remote)
-        request = ReserveRequest(qty=qty)
-        result = await self.vacancy_client.reserve(request)
+        if self._batcher is not None:
+            success, remaining, reason = await self._batcher.submit(qty)
+        else:
+            result = await self.vacancy_client.reserve(qty)
+            success, remaining, reason = result.success, result.remaining, result.message
 
-        if result.success:
+        if success:
             message = "Purchase successful!"
         else:
-            message = result.message or "Insufficient inventory"
+            message = reason or "Insufficient inventory"
+
+        return success, remaining, message
 
-        return result.success, result.remaining, message
+    async def _reserve_batch(self, quantities: list[int]) -> list[PurchaseResult]:
+        """
+        Reserve a batch of purchases with one vacancy call.
+
+        The whole batch is reserved at once. If stock is short, purchases
+        are admitted first-come-first-served while they fit in the reported
+        remaining stock and that subset is reserved instead; the rest fail.
+        """
+        result = await self.vacancy_client.reserve(sum(quantities))
+        accepted = [True] * len(quantities)
+        reason = None
+
+        if not result.success:
+            reason = result.message
+            budget = result.remaining
+            for i, qty in enumerate(quantities):
+                accepted[i] = qty <= budget
+                if accepted[i]:
+                    budget -= qty
+
+            admitted = result.remaining - budget
+            if admitted:
+                retry = await self.vacancy_client.reserve(admitted)
+                if not retry.success:
+                    # Stock moved underneath us (another instance); fail the batch
+                    accepted = [False] * len(quantities)
+                    reason = retry.message
+                result = retry
+
+        # Report remaining as if the purchases had run one after another
+        results: list[PurchaseResult] = []
+        remaining = result.remaining
+        for qty, ok in zip(reversed(quantities), reversed(accepted)):
+            results.append((ok, remaining, None if ok else reason))
+            if ok:
+                remaining += qty
+        results.reverse()
+        return results
 
     async def get_available(self) -> int:
         """
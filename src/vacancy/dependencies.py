@@ -1,6 +1,7 @@
 """Dependency injection for vacancy service."""
 import os
 import logging
+from functools import lru_cache
 
 try:
     from ..common.config import get_settings
@@ -12,9 +13,8 @@ from .services import HybridStockManager, VacancyService
 
 logger = logging.getLogger(__name__)
 
-# Global singleton - initialized once
+# Global singleton - initialized once (async, so it cannot use lru_cache)
 _global_stock_manager: HybridStockManager | None = None
-_global_vacancy_service: VacancyService | None = None
 
 
 def create_stock_manager_sync() -> HybridStockManager:
@@ -26,6 +26,12 @@ def create_stock_manager_sync() -> HybridStockManager:
         initial_stock=settings.initial_stock,
         redis_url=settings.redis_url,
         cache_ttl_seconds=settings.cache_ttl_seconds,
+        batch_window=settings.redis_batch_window_ms / 1000,
+        batch_max_items=settings.redis_batch_max_size,
+        redis_max_connections=settings.redis_max_connections,
+        connect_timeout=settings.redis_connect_timeout,
+        init_deadline=settings.redis_init_deadline,
+        client_tracking=settings.redis_client_tracking,
     )
 
 
@@ -44,29 +50,25 @@ async def get_stock_manager() -> HybridStockManager:
     return _global_stock_manager
 
 
+@lru_cache(maxsize=1)
 def get_vacancy_service() -> VacancyService:
     """Get vacancy service singleton - synchronous version."""
-    global _global_vacancy_service
-    
-    if _global_vacancy_service is None:
-        logger.info("Creating vacancy service for the first time")
-        # Use a simple in-memory manager for dependency injection
-        # The actual manager will be set during startup
-        from .services import InMemoryStockManager
-        temp_manager = InMemoryStockManager(initial_stock=10000)
-        _global_vacancy_service = VacancyService(temp_manager)
-        logger.info("Vacancy service created with temporary manager")
-    
-    return _global_vacancy_service
+    logger.info("Creating vacancy service for the first time")
+    # Use a simple in-memory manager for dependency injection
+    # The actual manager will be set during startup
+    from .services import InMemoryStockManager
+    temp_manager = InMemoryStockManager(initial_stock=10000)
+    vacancy_service = VacancyService(temp_manager)
+    logger.info("Vacancy service created with temporary manager")
+    return vacancy_service
 
 
 async def update_vacancy_service_manager():
     """Update the vacancy service to use the proper stock manager."""
-    global _global_vacancy_service
-    
-    if _global_vacancy_service:
+    if get_vacancy_service.cache_info().currsize:
+        vacancy_service = get_vacancy_service()
         logger.info("🔄 Updating vacancy service stock manager...")
-        old_manager_type = type(_global_vacancy_service.stock).__name__
+        old_manager_type = type(vacancy_service.stock).__name__
         logger.info(f"🔄 Old manager type: {old_manager_type}")
         
         stock_manager = await get_stock_manager()
@@ -74,11 +76,11 @@ async def update_vacancy_service_manager():
         logger.info(f"🔄 New manager type: {new_manager_type}")
         logger.info(f"🔄 New manager using Redis: {stock_manager._using_redis}")
         
-        _global_vacancy_service.stock = stock_manager
+        vacancy_service.stock = stock_manager
         logger.info("✅ Vacancy service updated with proper stock manager")
         
         # Test the new manager
-        test_current = await _global_vacancy_service.get_available()
+        test_current = await vacancy_service.get_available()
         logger.info(f"✅ Test after update - current stock: {test_current}")
     else:
         logger.warning("⚠️ No vacancy service to update")
@@ -86,12 +88,12 @@ async def update_vacancy_service_manager():
 
 async def cleanup_dependencies():
     """Cleanup global dependencies during shutdown."""
-    global _global_stock_manager, _global_vacancy_service
+    global _global_stock_manager
     
     logger.info("Cleaning up dependencies...")
     if _global_stock_manager:
         await _global_stock_manager.close()
         _global_stock_manager = None
     
-    _global_vacancy_service = None
+    get_vacancy_service.cache_clear()
     logger.info("Dependencies cleaned up")
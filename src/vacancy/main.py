@@ -1,12 +1,12 @@
 """Vacancy service FastAPI application."""
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 
 # For standalone execution without relative imports
 from common.config import get_settings
-from common.logging import setup_logging
+from common.logging import setup_logging, start_log_listeners, stop_log_listeners
+from common.middleware import DocsGZipMiddleware, add_cors_middleware
+from common.responses import ORJSONResponse
 
 from .routes import router
 from .dependencies import cleanup_dependencies, get_stock_manager, update_vacancy_service_manager
@@ -23,7 +23,8 @@ logger = setup_logging(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application lifespan events."""
-    # Startup
+    # Startup (log writers start here, in the worker process)
+    start_log_listeners()
     logger.info(f"Starting Vacancy Service on port {settings.vacancy_port}")
     logger.info(f"Initial stock: {settings.initial_stock}")
     
@@ -81,6 +82,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Vacancy Service")
     await cleanup_dependencies()
+    stop_log_listeners()
 
 
 # Create FastAPI application
@@ -90,19 +92,15 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# Add middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure per environment in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add middleware (CORS only if browser origins are configured)
+add_cors_middleware(app, settings)
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Compress docs/OpenAPI only; API responses are too small to benefit
+app.add_middleware(DocsGZipMiddleware, minimum_size=1000)
 
 # Include routers
 app.include_router(router)
@@ -1,30 +1,38 @@
 """API routes for vacancy service."""
-from fastapi import APIRouter, HTTPException, Depends
+import logging
+
+from fastapi import APIRouter, HTTPException, Depends, Response
 
 # For standalone execution without relative imports
 from common.models import ReserveRequest, ReserveResponse, AvailableResponse, HealthResponse
-from common.logging import setup_logging
+
+from common.responses import ORJSONResponse
 
 from .services import VacancyService
 from .dependencies import get_vacancy_service
 
-# Setup logging
-logger = setup_logging("vacancy-service")
+# Shared service logger (configured by the application entrypoint)
+logger = logging.getLogger("vacancy-service")
 
 # Create router with API versioning
 router = APIRouter(prefix="/api/v1", tags=["vacancy"])
 
+# Handlers return ORJSONResponse built from plain dicts with
+# response_model=None, so FastAPI skips the response validation pass;
+# the models are still published in the OpenAPI schema via `responses`
+
 
 @router.post(
     "/reserve",
-    response_model=ReserveResponse,
+    response_model=None,
     summary="Reserve tickets",
     description="Attempt to reserve a specified quantity of tickets from inventory",
+    responses={200: {"model": ReserveResponse}},
 )
 async def reserve_tickets(
     request: ReserveRequest,
     service: VacancyService = Depends(get_vacancy_service),
-) -> ReserveResponse:
+) -> ORJSONResponse:
     """
     Reserve tickets from inventory.
 
@@ -33,48 +41,65 @@ async def reserve_tickets(
     Returns reservation status and remaining inventory.
     """
     try:
-        logger.info(f"Reserve request: qty={request.qty}")
+        logger.info("Reserve request: qty=%s", request.qty)
         success, remaining, message = await service.reserve(request.qty)
 
-        return ReserveResponse(
-            success=success,
-            remaining=remaining,
-            message=message,
-        )
+        return ORJSONResponse({
+            "success": success,
+            "remaining": remaining,
+            "message": message,
+        })
 
     except ValueError as e:
-        logger.warning(f"Invalid reservation request: {e}")
+        logger.warning("Invalid reservation request: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get(
     "/available",
-    response_model=AvailableResponse,
+    response_model=None,
     summary="Get available inventory",
     description="Retrieve the current number of available tickets",
+    responses={200: {"model": AvailableResponse}},
 )
 async def get_available(
     service: VacancyService = Depends(get_vacancy_service),
-) -> AvailableResponse:
+) -> ORJSONResponse:
     """
     Get available inventory.
 
     Returns the current number of tickets available for reservation.
     """
     qty = await service.get_available()
-    logger.debug(f"Available inventory: {qty}")
-    return AvailableResponse(qty=qty)
+    logger.debug("Available inventory: %s", qty)
+    return ORJSONResponse({"qty": qty})
+
+
+@router.head("/health", include_in_schema=False)
+async def health_probe(
+    service: VacancyService = Depends(get_vacancy_service),
+) -> Response:
+    """
+    Lightweight health probe.
+
+    Answers HEAD from in-process state (no Redis call): 200 whenever the
+    service can serve, including from the in-memory fallback while Redis
+    reconnects (GET /health reports that as "degraded"). Used by the
+    ticket service's background health probe.
+    """
+    return Response(status_code=200)
 
 
 @router.get(
     "/health",
-    response_model=HealthResponse,
+    response_model=None,
     summary="Health check",
     description="Check if the vacancy service is healthy and operational",
+    responses={200: {"model": HealthResponse}},
 )
 async def health_check(
     service: VacancyService = Depends(get_vacancy_service),
-) -> HealthResponse:
+) -> ORJSONResponse:
     """
     Health check endpoint.
 
@@ -90,21 +115,22 @@ async def health_check(
         details = {
             "backend": backend,
             "current_stock": current_stock,
-            "using_redis": backend == "redis"
+            "using_redis": backend == "redis",
+            "degraded": service.degraded,
         }
         
         if "redis_status" in health_status:
             details["redis_status"] = health_status["redis_status"]
         
-        return HealthResponse(
-            status=health_status.get("status", "healthy"), 
-            service="vacancy",
-            details=details
-        )
+        return ORJSONResponse({
+            "status": health_status.get("status", "healthy"),
+            "service": "vacancy",
+            "details": details,
+        })
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return HealthResponse(
-            status="unhealthy", 
-            service="vacancy",
-            details={"error": str(e)}
-        )
+        logger.error("Health check failed: %s", e)
+        return ORJSONResponse({
+            "status": "unhealthy",
+            "service": "vacancy",
+            "details": {"error": str(e)},
+        })
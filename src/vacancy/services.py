@@ -1,41 +1,56 @@
 """Vacancy service business logic."""
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import random
+import time
 from typing import Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from common.redis_client import RedisStockManager
+    from common.redis_client import REDIS_UNAVAILABLE_ERRORS, RedisStockManager, create_connection_pool
 else:
     try:
-        from ..common.redis_client import RedisStockManager
+        from ..common.redis_client import REDIS_UNAVAILABLE_ERRORS, RedisStockManager, create_connection_pool
     except ImportError:
         # For standalone testing without relative imports
-        from common.redis_client import RedisStockManager
+        from common.redis_client import REDIS_UNAVAILABLE_ERRORS, RedisStockManager, create_connection_pool
 
 logger = logging.getLogger(__name__)
 
+# Reservation messages built once: small quantities cover nearly every
+# request, so the hot path does no string formatting
+_RESERVED_MSGS = tuple(f"Reserved {i} tickets" for i in range(64))
+_INSUFFICIENT = "Insufficient inventory"
+
+# Max seconds the failover spends reading the last Redis stock
+_FAILOVER_SYNC_TIMEOUT = 0.5
+
+# Cap on the delay between background reconnection attempts
+_RECONNECT_MAX_DELAY = 5.0
+
 
 class InMemoryStockManager:
     """
-    Thread-safe in-memory stock management with caching.
-    Implements atomic operations to prevent race conditions.
+    In-memory stock management with caching.
     Used as fallback when Redis is unavailable.
+
+    Operations are atomic without a lock: each check-and-update runs with
+    no await inside, so no other coroutine on the event loop can interleave.
+
+    The read cache has no TTL: every write goes through this object and
+    invalidates it, so a cached value stays valid until the next write.
     """
 
-    def __init__(self, initial_stock: int, cache_ttl_seconds: int = 1):
+    def __init__(self, initial_stock: int):
         """
         Initialize stock manager.
 
         Args:
             initial_stock: Initial inventory quantity
-            cache_ttl_seconds: Cache TTL for read operations
         """
         self.total = initial_stock
-        self.lock = asyncio.Lock()
-        self._cached_total: Optional[int] = None
-        self._cache_expiry: Optional[datetime] = None
-        self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
+        # Cache starts warm: the first read needs no refresh
+        self._cached_total = initial_stock
+        self._cache_dirty = False
 
     async def reserve(self, qty: int) -> tuple[bool, int]:
         """
@@ -53,12 +68,13 @@ class InMemoryStockManager:
         if qty <= 0:
             raise ValueError(f"Quantity must be positive, got {qty}")
 
-        async with self.lock:
-            if self.total >= qty:
-                self.total -= qty
-                self._invalidate_cache()
-                return True, self.total
-            return False, self.total
+        # No yield point between check and decrement (keep it that way:
+        # no await or logging in here)
+        if self.total >= qty:
+            self.total -= qty
+            self._cache_dirty = True
+            return True, self.total
+        return False, self.total
 
     async def get_current(self, use_cache: bool = True) -> int:
         """
@@ -70,99 +86,195 @@ class InMemoryStockManager:
         Returns:
             Current inventory quantity
         """
-        if use_cache and self._is_cache_valid():
+        if use_cache and not self._cache_dirty:
             return self._cached_total
 
-        async with self.lock:
-            self._update_cache()
-            return self.total
-
-    def _is_cache_valid(self) -> bool:
-        """Check if cache is still valid."""
-        return (
-            self._cache_expiry is not None
-            and datetime.now() < self._cache_expiry
-        )
-
-    def _update_cache(self) -> None:
-        """Update cache with current value."""
         self._cached_total = self.total
-        self._cache_expiry = datetime.now() + self._cache_ttl
+        self._cache_dirty = False
+        return self._cached_total
 
-    def _invalidate_cache(self) -> None:
-        """Invalidate cache after write."""
-        self._cache_expiry = None
+    def set_total(self, total: int) -> None:
+        """Overwrite the stock level (e.g. to resync with Redis) and refresh the cache."""
+        self.total = total
+        self._cached_total = total
+        self._cache_dirty = False
 
 
 class HybridStockManager:
     """
     Hybrid stock manager that uses Redis as primary and in-memory as fallback.
     Provides distributed atomic operations with high availability.
+
+    Redis-backed reads use the Redis manager's CLIENT TRACKING cache when
+    it is active (exact: invalidated by the server, no round-trip).
+    Otherwise they are stale-while-revalidate: the last known value is
+    returned at once and, once older than cache_ttl_seconds, refreshed in
+    the background, so a read may lag Redis by up to cache_ttl_seconds
+    (plus one refresh round-trip).
+
+    When Redis becomes unreachable at runtime, stock is served from the
+    in-memory fallback while a background task reconnects; reservations
+    taken in the meantime are applied to Redis before it is used again.
     """
 
-    def __init__(self, initial_stock: int, redis_url: Optional[str] = None, cache_ttl_seconds: int = 1):
+    def __init__(
+        self,
+        initial_stock: int,
+        redis_url: Optional[str] = None,
+        cache_ttl_seconds: int = 1,
+        batch_window: float = 0.001,
+        batch_max_items: int = 64,
+        redis_max_connections: int = 100,
+        connect_timeout: float = 1.5,
+        init_deadline: float = 10.0,
+        client_tracking: bool = True,
+    ):
         """
         Initialize hybrid stock manager.
 
         Args:
             initial_stock: Initial inventory quantity
             redis_url: Redis connection URL (if None, uses in-memory only)
-            cache_ttl_seconds: Cache TTL for read operations
+            cache_ttl_seconds: Max staleness of Redis reads when client
+                               tracking is unavailable (stale-while-revalidate
+                               period; unused by the in-memory fallback,
+                               which invalidates on write)
+            batch_window: Seconds to coalesce concurrent Redis reserves
+            batch_max_items: Max Redis reserves per batch (1 disables batching)
+            redis_max_connections: Redis connection pool size
+            connect_timeout: Seconds allowed per Redis connection attempt
+            init_deadline: Seconds allowed for all attempts before falling
+                           back to in-memory
+            client_tracking: Cache Redis stock reads locally, invalidated
+                             by the server (CLIENT TRACKING)
         """
         self.initial_stock = initial_stock
         self.redis_url = redis_url
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.batch_window = batch_window
+        self.batch_max_items = batch_max_items
+        self.redis_max_connections = redis_max_connections
+        self.connect_timeout = connect_timeout
+        self.init_deadline = init_deadline
+        self.client_tracking = client_tracking
         self.redis_manager: Optional[RedisStockManager] = None
-        self.fallback_manager = InMemoryStockManager(initial_stock, cache_ttl_seconds)
+        self._redis_pool = None
+        self.fallback_manager = InMemoryStockManager(initial_stock)
         self._using_redis = False
 
+        # Stale-while-revalidate value for Redis reads (None until first read)
+        self._swr_value: Optional[int] = None
+        self._swr_deadline = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Failover: the first failing call syncs the fallback, concurrent
+        # failures wait for it instead of retrying Redis. _fallback_base is
+        # the stock the fallback started from, so the reconnect task can
+        # push the reservations it took back to Redis
+        self._failover_lock = asyncio.Lock()
+        self._failover_done = False
+        self._fallback_base = 0
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+        # Hot-path debug logging: level checked once (logging is configured
+        # before the manager is built), call resolved once
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        self._log_debug = logger.debug
+
     async def initialize(self) -> None:
         """Initialize the stock manager and determine which backend to use."""
         logger.info(f"🔧 HybridStockManager.initialize() called with redis_url: {self.redis_url}")
         
         if self.redis_url:
-            # Retry logic for Kubernetes environment
-            max_retries = 5
-            retry_delay = 2  # seconds
-            
-            for attempt in range(1, max_retries + 1):
-                try:
-                    logger.info(f"📡 Attempt {attempt}/{max_retries}: Creating RedisStockManager...")
-                    self.redis_manager = RedisStockManager(redis_url=self.redis_url)
-                    
-                    logger.info(f"📡 Attempt {attempt}/{max_retries}: Connecting to Redis...")
-                    await self.redis_manager.connect()
-                    
-                    logger.info(f"📡 Attempt {attempt}/{max_retries}: Testing Redis connection...")
-                    await self.redis_manager.redis.ping()
-                    
-                    logger.info(f"📡 Attempt {attempt}/{max_retries}: Initializing Redis stock with {self.initial_stock}...")
-                    await self.redis_manager.initialize_stock(self.initial_stock)
-                    
-                    # Verify Redis is working
-                    current_redis = await self.redis_manager.get_current()
-                    logger.info(f"✅ Redis connection successful! Current stock: {current_redis}")
-                    
-                    self._using_redis = True
-                    logger.info("✅ HybridStockManager initialized with Redis backend")
-                    return  # Success, exit retry loop
-                    
-                except Exception as e:
-                    logger.warning(f"❌ Attempt {attempt}/{max_retries} failed: {e}")
-                    if attempt < max_retries:
-                        logger.info(f"⏳ Retrying in {retry_delay} seconds...")
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 1.5  # Exponential backoff
-                    else:
-                        logger.error(f"❌ All {max_retries} Redis connection attempts failed")
-                        logger.exception("Final Redis initialization error:")
-            
-            # If we get here, all retries failed
-            logger.warning("❌ Redis initialization failed after all retries, using in-memory fallback")
+            # One connection pool shared by every attempt (and then by the
+            # connected manager) instead of a new URL-based client per attempt
+            self._redis_pool = create_connection_pool(self.redis_url, self.redis_max_connections)
+
+            # Overall deadline: the pod comes up on Redis quickly or falls
+            # back quickly, instead of spending its startup on a doomed retry loop
+            try:
+                current = await asyncio.wait_for(self._connect_redis(), timeout=self.init_deadline)
+
+                # Prewarm both read paths with the stock read during startup,
+                # so the first /available needs no Redis hop and a later
+                # failover starts from the Redis value
+                self._set_swr(current)
+                self.fallback_manager.set_total(current)
+                self._using_redis = True
+                logger.info("✅ HybridStockManager initialized with Redis backend")
+                return
+            except asyncio.TimeoutError:
+                logger.error(f"❌ Redis initialization exceeded {self.init_deadline}s deadline")
+            except Exception:
+                logger.exception("Final Redis initialization error:")
+
+            logger.warning("❌ Redis initialization failed, using in-memory fallback")
             self._using_redis = False
+            await self._redis_pool.disconnect()
+            self._redis_pool = None
         else:
             logger.info("ℹ️ No Redis URL provided, using in-memory backend")
             self._using_redis = False
 
+    @property
+    def degraded(self) -> bool:
+        """True while Redis is configured but stock is served by the in-memory fallback."""
+        return bool(self.redis_url) and not self._using_redis
+
+    async def _connect_redis(self) -> int:
+        """
+        Connect to Redis with jittered exponential backoff (Kubernetes: Redis
+        may still be starting). Each attempt is bounded by connect_timeout.
+
+        Returns:
+            Current Redis stock
+
+        Raises:
+            Exception: The last attempt's error once retries are exhausted
+        """
+        max_retries = 5
+
+        for attempt in range(1, max_retries + 1):
+            logger.info(f"📡 Attempt {attempt}/{max_retries}: Connecting to Redis...")
+            self.redis_manager = RedisStockManager(
+                redis_url=self.redis_url,
+                batch_window=self.batch_window,
+                batch_max_items=self.batch_max_items,
+                max_connections=self.redis_max_connections,
+                connection_pool=self._redis_pool,
+                client_tracking=self.client_tracking,
+            )
+
+            connected = False
+            try:
+                # PING + script preload, then SET NX + GET: two pipelined round-trips
+                current_redis = await asyncio.wait_for(
+                    self._connect_attempt(self.redis_manager),
+                    timeout=self.connect_timeout,
+                )
+                connected = True
+                logger.info(f"✅ Redis connection successful! Current stock: {current_redis}")
+                return current_redis
+
+            except Exception as e:
+                logger.warning(f"❌ Attempt {attempt}/{max_retries} failed: {e}")
+                if attempt == max_retries:
+                    raise
+
+            finally:
+                if not connected:
+                    # Stops the batcher; the shared pool stays open
+                    await self.redis_manager.disconnect()
+
+            retry_delay = min(5.0, 0.2 * 2 ** attempt + random.uniform(0, 0.2))
+            logger.info(f"⏳ Retrying in {retry_delay:.2f} seconds...")
+            await asyncio.sleep(retry_delay)
+
+    async def _connect_attempt(self, manager: RedisStockManager) -> int:
+        """Connect and seed the stock key; returns the current stock."""
+        await manager.connect()
+        return await manager.initialize_stock(self.initial_stock)
+
     async def reserve(self, qty: int) -> tuple[bool, int]:
         """
         Attempt to reserve quantity using Redis or fallback.
@@ -173,28 +285,19 @@ class HybridStockManager:
         Returns:
             Tuple of (success, remaining_after_operation)
         """
-        logger.info(f"HybridStockManager.reserve() called: qty={qty}, using_redis={self._using_redis}")
-        
-        if self._using_redis and self.redis_manager:
+        if self._debug_enabled:
+            self._log_debug("HybridStockManager.reserve(): qty=%s, using_redis=%s", qty, self._using_redis)
+
+        manager = self.redis_manager
+        if self._using_redis and manager:
             try:
-                logger.info("Using Redis for reserve operation")
-                result = await self.redis_manager.reserve(qty)
-                logger.info(f"Redis reserve result: {result}")
-                return result
-            except Exception as e:
-                logger.error(f"Redis reserve failed, falling back to in-memory: {e}")
-                self._using_redis = False
-                # Sync fallback manager with last known Redis state if possible
-                try:
-                    current_redis = await self.redis_manager.get_current()
-                    self.fallback_manager.total = current_redis
-                except Exception:
-                    pass
-        
-        logger.info("Using in-memory fallback for reserve operation")
-        result = await self.fallback_manager.reserve(qty)
-        logger.info(f"In-memory reserve result: {result}")
-        return result
+                success, remaining = await manager.reserve(qty)
+                self._swr_value = remaining
+                return success, remaining
+            except REDIS_UNAVAILABLE_ERRORS as e:
+                await self._fail_over(manager, "reserve", e)
+
+        return await self.fallback_manager.reserve(qty)
 
     async def get_current(self, use_cache: bool = True) -> int:
         """
@@ -206,22 +309,152 @@ class HybridStockManager:
         Returns:
             Current inventory quantity
         """
-        logger.info(f"HybridStockManager.get_current() called: use_cache={use_cache}, using_redis={self._using_redis}")
-        
-        if self._using_redis and self.redis_manager:
+        if self._debug_enabled:
+            self._log_debug("HybridStockManager.get_current(): use_cache=%s, using_redis=%s", use_cache, self._using_redis)
+
+        manager = self.redis_manager
+        if self._using_redis and manager:
+            # Tracking gives an exact, RTT-free cached read: SWR only stands
+            # in when it is off (unsupported, disabled or lost)
+            if use_cache and self._swr_value is not None and not manager.tracking:
+                # Serve the last value; revalidate in the background once stale
+                if self._refresh_task is None and time.monotonic() > self._swr_deadline:
+                    self._refresh_task = asyncio.create_task(self._refresh_swr())
+                return self._swr_value
+
             try:
-                logger.info("Using Redis for get_current operation")
-                result = await self.redis_manager.get_current(use_cache)
-                logger.info(f"Redis get_current result: {result}")
-                return result
-            except Exception as e:
-                logger.error(f"Redis get_current failed, falling back to in-memory: {e}")
-                self._using_redis = False
-        
-        logger.info("Using in-memory fallback for get_current operation")
-        result = await self.fallback_manager.get_current(use_cache)
-        logger.info(f"In-memory get_current result: {result}")
-        return result
+                current = await manager.get_current(use_cache)
+                self._set_swr(current)
+                return current
+            except REDIS_UNAVAILABLE_ERRORS as e:
+                await self._fail_over(manager, "get_current", e)
+
+        return await self.fallback_manager.get_current(use_cache)
+
+    async def _fail_over(self, manager: RedisStockManager, operation: str, error: Exception) -> None:
+        """
+        Switch to the in-memory fallback and start reconnecting.
+
+        The first caller syncs the fallback with the last known Redis stock
+        (a short, bounded read, else the last value seen) while concurrent
+        failures wait on the lock and then go straight to the fallback.
+        Failures from a manager that has already been replaced are ignored.
+        """
+        if self._failover_done or manager is not self.redis_manager:
+            return
+
+        async with self._failover_lock:
+            if self._failover_done or manager is not self.redis_manager:
+                return
+
+            logger.error("Redis %s failed, falling back to in-memory: %s", operation, error)
+            try:
+                current = await asyncio.wait_for(
+                    manager.get_current(), timeout=_FAILOVER_SYNC_TIMEOUT
+                )
+            except REDIS_UNAVAILABLE_ERRORS:
+                current = self._swr_value
+            if current is not None:
+                self.fallback_manager.set_total(current)
+            self._fallback_base = await self.fallback_manager.get_current()
+
+            self._using_redis = False
+            self._failover_done = True
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """
+        Reconnect to Redis in the background after a failover.
+
+        Retries with jittered exponential backoff until Redis answers, then
+        applies the reservations taken by the fallback and switches back.
+        """
+        # Stops the failed manager's batcher and tracking; the shared pool stays open
+        await self.redis_manager.disconnect()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            await asyncio.sleep(min(_RECONNECT_MAX_DELAY, 0.2 * 2 ** attempt + random.uniform(0, 0.2)))
+
+            manager = RedisStockManager(
+                redis_url=self.redis_url,
+                batch_window=self.batch_window,
+                batch_max_items=self.batch_max_items,
+                max_connections=self.redis_max_connections,
+                connection_pool=self._redis_pool,
+                client_tracking=self.client_tracking,
+            )
+
+            connected = False
+            try:
+                # Only the connect is bounded: cancelling an in-flight DECRBY
+                # could apply it twice (socket timeouts bound the resync)
+                await asyncio.wait_for(manager.connect(), timeout=self.connect_timeout)
+                current = await self._resync(manager)
+                connected = True
+            except REDIS_UNAVAILABLE_ERRORS as e:
+                logger.warning(f"Redis reconnection attempt {attempt} failed: {e}")
+                continue
+            except Exception:
+                logger.exception(f"Redis reconnection attempt {attempt} failed:")
+                continue
+            finally:
+                if not connected:
+                    await manager.disconnect()
+
+            # No await from the last resync step to here: the fallback cannot
+            # take a reservation that would not be in Redis
+            self.redis_manager = manager
+            self._set_swr(current)
+            self._using_redis = True
+            self._failover_done = False
+            self._reconnect_task = None
+            logger.info(f"✅ Redis reconnected after {attempt} attempt(s), stock: {current}")
+            return
+
+    async def _resync(self, manager: RedisStockManager) -> int:
+        """
+        Apply the fallback's reservations to Redis through a connected manager.
+
+        A missing key (Redis lost its data) is recreated from the fallback
+        total; otherwise the units the fallback reserved are decremented,
+        repeating until no new reservation arrived during the round-trip.
+
+        Returns:
+            Current Redis stock
+        """
+        total = await self.fallback_manager.get_current(use_cache=False)
+        if await manager.redis.set(manager.stock_key, total, nx=True):
+            self._fallback_base = total
+            logger.info(f"Redis stock was missing, restored to {total}")
+
+        current = await manager.get_current(use_cache=False)
+        while (pending := self._fallback_base - await self.fallback_manager.get_current(use_cache=False)):
+            current = await manager.redis.decrby(manager.stock_key, pending)
+            self._fallback_base -= pending
+            logger.info(f"Applied {pending} fallback reservation(s) to Redis, stock: {current}")
+
+        if current < 0:
+            logger.warning(f"Redis stock is {current}: fallback reservations overlapped other instances")
+        return current
+
+    def _set_swr(self, value: int) -> None:
+        """Store a fresh Redis read and restart its staleness period."""
+        self._swr_value = value
+        self._swr_deadline = time.monotonic() + self.cache_ttl_seconds
+
+    async def _refresh_swr(self) -> None:
+        """Background revalidation of the stale-while-revalidate value."""
+        manager = self.redis_manager
+        try:
+            self._set_swr(await manager.get_current())
+        except REDIS_UNAVAILABLE_ERRORS as e:
+            await self._fail_over(manager, "refresh", e)
+        except Exception:
+            logger.exception("Stock revalidation failed:")
+        finally:
+            self._refresh_task = None
 
     async def health_check(self) -> dict:
         """
@@ -247,12 +480,26 @@ class HybridStockManager:
 
     async def close(self) -> None:
         """Close connections and cleanup resources."""
+        for task in (self._refresh_task, self._reconnect_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._refresh_task = None
+        self._reconnect_task = None
+
         if self.redis_manager:
             try:
                 await self.redis_manager.close()
             except Exception as e:
                 logger.error(f"Error closing Redis connection: {e}")
 
+        if self._redis_pool:
+            await self._redis_pool.disconnect()
+            self._redis_pool = None
+
 
 class VacancyService:
     """Vacancy service - handles inventory operations."""
@@ -266,6 +513,24 @@ class VacancyService:
         """
         self.stock = stock_manager
 
+    @property
+    def stock(self) -> Union[HybridStockManager, InMemoryStockManager]:
+        """Current stock manager."""
+        return self._stock
+
+    @stock.setter
+    def stock(self, stock_manager: Union[HybridStockManager, InMemoryStockManager]) -> None:
+        """Swap the stock manager and rebind its methods (resolved once, not per call)."""
+        self._stock = stock_manager
+        self._reserve = stock_manager.reserve
+        self._get_current = stock_manager.get_current
+        self._health_check = getattr(stock_manager, "health_check", None)
+
+    @property
+    def degraded(self) -> bool:
+        """Whether stock is served by a per-process fallback instead of Redis."""
+        return getattr(self._stock, "degraded", False)
+
     async def reserve(self, qty: int) -> tuple[bool, int, str]:
         """
         Reserve tickets.
@@ -279,12 +544,14 @@ class VacancyService:
         Raises:
             ValueError: If quantity is invalid
         """
-        success, remaining = await self.stock.reserve(qty)
+        success, remaining = await self._reserve(qty)
 
-        if success:
-            message = f"Reserved {qty} tickets"
+        if not success:
+            message = _INSUFFICIENT
+        elif qty < 64:
+            message = _RESERVED_MSGS[qty]
         else:
-            message = "Insufficient inventory"
+            message = f"Reserved {qty} tickets"
 
         return success, remaining, message
 
@@ -295,7 +562,7 @@ class VacancyService:
         Returns:
             Available quantity
         """
-        return await self.stock.get_current()
+        return await self._get_current()
 
     async def health_check(self) -> dict:
         """
@@ -304,8 +571,8 @@ class VacancyService:
         Returns:
             Health status dictionary
         """
-        if hasattr(self.stock, 'health_check'):
-            return await self.stock.health_check()
+        if self._health_check is not None:
+            return await self._health_check()
         else:
             current_stock = await self.get_available()
             return {
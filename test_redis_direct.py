@@ -21,26 +21,30 @@ async def test_redis_directly():
         redis_manager = RedisStockManager(redis_url="redis://localhost:6379/0")
         print("   ✅ RedisStockManager criado")
         
-        # Conectar
+        # Conectar (PING + carga dos scripts Lua num único round-trip)
         await redis_manager.connect()
         print("   ✅ Conexão estabelecida")
         
-        # Inicializar stock
-        await redis_manager.initialize_stock(10000)
-        print("   ✅ Stock inicializado com 10000")
+        # Inicializar, ler, decrementar e reler o stock num único round-trip
+        async with redis_manager.redis.pipeline(transaction=False) as pipe:
+            pipe.set(redis_manager.stock_key, 10000)
+            pipe.get(redis_manager.stock_key)
+            pipe.decrby(redis_manager.stock_key, 5)
+            pipe.get(redis_manager.stock_key)
+            was_set, current, decremented, current_after = await pipe.execute()
         
-        # Verificar stock atual
-        current = await redis_manager.get_current()
-        print(f"   ✅ Stock atual: {current}")
+        assert was_set is True
+        assert int(current) == 10000
+        assert decremented == 9995
+        assert int(current_after) == 9995
+        print(f"   ✅ Stock inicializado com 10000, após DECRBY 5: {current_after}")
         
-        # Testar reserva
+        # Testar reserva (script Lua atômico)
         success, remaining = await redis_manager.reserve(5)
+        assert success is True
+        assert remaining == 9990
         print(f"   ✅ Reserva de 5: success={success}, remaining={remaining}")
         
-        # Verificar stock após reserva
-        current_after = await redis_manager.get_current()
-        print(f"   ✅ Stock após reserva: {current_after}")
-        
         # Health check
         health = await redis_manager.health_check()
         print(f"   ✅ Health check: {health}")
@@ -9,14 +9,8 @@ import os
 # Add src to Python path
 sys.path.insert(0, '/Users/flavio/Developer/Labs/python/ticket-system/src')
 
-# Fix import paths for testing
-import vacancy.services
-import common.redis_client
-
-# Import classes directly
-HybridStockManager = vacancy.services.HybridStockManager
-InMemoryStockManager = vacancy.services.InMemoryStockManager
-RedisStockManager = common.redis_client.RedisStockManager
+from vacancy.services import HybridStockManager, InMemoryStockManager
+from common.redis_client import RedisStockManager
 
 
 async def test_in_memory_manager():